@@ -93,6 +93,8 @@ SERVICE_TO_METHOD = {
 }
 
 FAN_SPEEDS = {"Silent": 0, "Standard": 1, "Medium": 2, "Turbo": 3}
+FAN_SPEEDS_INV = {value: key for key, value in FAN_SPEEDS.items()}
+FAN_SPEEDS_LIST = sorted(FAN_SPEEDS, key=FAN_SPEEDS.get)
 
 
 SUPPORT_XIAOMI = (
@@ -108,16 +110,23 @@ SUPPORT_XIAOMI = (
 )
 
 
-STATE_CODE_TO_STATE = {
-    0: STATE_IDLE,
-    1: STATE_IDLE,
-    2: STATE_PAUSED,
-    3: STATE_CLEANING,
-    4: STATE_RETURNING,
-    5: STATE_DOCKED,
-    6: STATE_CLEANING,  # Vacuum & Mop
-    7: STATE_CLEANING   # Mop only
-}
+# Indexed by run_state.
+STATE_CODE_TO_STATE = (
+    STATE_IDLE,
+    STATE_IDLE,
+    STATE_PAUSED,
+    STATE_CLEANING,
+    STATE_RETURNING,
+    STATE_DOCKED,
+    STATE_CLEANING,  # Vacuum & Mop
+    STATE_CLEANING   # Mop only
+)
+
+ZONE_FORMAT = "%d_0_%s_%s_%s_%s_%s_%s_%s_%s"
+
+OP_START = 1
+OP_PAUSE = 3
+MOP_TO_ACTION_MODE = {2: 3}
 
 ALL_PROPS = ["run_state", "mode", "err_state", "battary_life", "box_type", "mop_type", "s_time",
              "s_area", "suction_grade", "water_grade", "remember_map", "has_map", "is_mop", "has_newmap"]
@@ -148,26 +157,26 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         key: value for key, value in service.data.items() if key != ATTR_ENTITY_ID
     }
     entity_ids = service.data.get(ATTR_ENTITY_ID)
+    all_vacuums = tuple(hass.data[DATA_KEY].values())
 
     if entity_ids:
-      target_vacuums = [
-          vac
-          for vac in hass.data[DATA_KEY].values()
-          if vac.entity_id in entity_ids
-      ]
+      entity_ids = frozenset(entity_ids)
+      target_vacuums = tuple(
+          vac for vac in all_vacuums if vac.entity_id in entity_ids
+      )
     else:
-      target_vacuums = hass.data[DATA_KEY].values()
-
-    update_tasks = []
-    for vacuum in target_vacuums:
-      await getattr(vacuum, method["method"])(**params)
+      target_vacuums = all_vacuums
 
-    for vacuum in target_vacuums:
-      update_coro = vacuum.async_update_ha_state(True)
-      update_tasks.append(update_coro)
+    await asyncio.gather(
+        *[getattr(vac, method["method"])(**params) for vac in target_vacuums]
+    )
+    await asyncio.gather(
+        *[vac.async_update_ha_state(True) for vac in target_vacuums]
+    )
 
-    if update_tasks:
-      await asyncio.wait(update_tasks)
+  # Services act on every registered vacuum, only the first platform setup registers them.
+  if hass.services.has_service(DOMAIN, SERVICE_CLEAN_ZONE):
+    return
 
   for vacuum_service in SERVICE_TO_METHOD:
     schema = SERVICE_TO_METHOD[vacuum_service].get("schema", VACUUM_SERVICE_SCHEMA)
@@ -179,14 +188,19 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 class MiroboVacuum2(StateVacuumEntity):
   """Representation of a Xiaomi Vacuum cleaner robot."""
 
+  # The entity base class keeps its __dict__, these just skip it on hot reads.
+  __slots__ = ("_name", "_vacuum", "_raw", "_last_clean_point", "vacuum_state", "_available", "_state")
+
   def __init__(self, name, vacuum):
     """Initialize the Xiaomi vacuum cleaner robot handler."""
     self._name = name
     self._vacuum = vacuum
+    self._raw = vacuum.raw_command
 
     self._last_clean_point = None
 
     self.vacuum_state = None
+    self._state = None
     self._available = False
 
   @property
@@ -197,18 +211,7 @@ class MiroboVacuum2(StateVacuumEntity):
   @property
   def state(self):
     """Return the status of the vacuum cleaner."""
-    if self.vacuum_state is not None:
-      # The vacuum reverts back to an idle state after erroring out.
-      # We want to keep returning an error until it has been cleared.
-
-      try:
-        return STATE_CODE_TO_STATE[int(self.vacuum_state['run_state'])]
-      except KeyError:
-        _LOGGER.error(
-            "STATE not supported, state_code: %s",
-            self.vacuum_state['run_state'],
-        )
-        return None
+    return self._state
 
   @property
   def battery_level(self):
@@ -221,14 +224,12 @@ class MiroboVacuum2(StateVacuumEntity):
     """Return the fan speed of the vacuum cleaner."""
     if self.vacuum_state is not None:
       speed = self.vacuum_state['suction_grade']
-      if speed in FAN_SPEEDS.values():
-        return [key for key, value in FAN_SPEEDS.items() if value == speed][0]
-      return speed
+      return FAN_SPEEDS_INV.get(speed, speed)
 
   @property
   def fan_speed_list(self):
     """Get the list of available fan speed steps of the vacuum cleaner."""
-    return list(sorted(FAN_SPEEDS.keys(), key=lambda s: FAN_SPEEDS[s]))
+    return FAN_SPEEDS_LIST
 
   @property
   def device_state_attributes(self):
@@ -236,10 +237,9 @@ class MiroboVacuum2(StateVacuumEntity):
     attrs = {}
     if self.vacuum_state is not None:
       attrs.update(self.vacuum_state)
-      try:
-        attrs['status'] = STATE_CODE_TO_STATE[int(self.vacuum_state['run_state'])]
-      except KeyError:
+      if self._state is None:
         return "Definition missing for state %s" % self.vacuum_state['run_state']
+      attrs['status'] = self._state
     return attrs
 
   @property
@@ -255,61 +255,45 @@ class MiroboVacuum2(StateVacuumEntity):
   async def _try_command(self, mask_error, func, *args, **kwargs):
     """Call a vacuum command handling error messages."""
     try:
-      await self.hass.async_add_executor_job(partial(func, *args, **kwargs))
+      if kwargs:
+        func = partial(func, **kwargs)
+      await self.hass.async_add_executor_job(func, *args)
       return True
     except DeviceException as exc:
       _LOGGER.error(mask_error, exc)
       return False
 
-  async def async_start(self):
-    """Start or resume the cleaning task."""
+  def _mode_command(self, op_code):
+    """Return the raw command and params applying op_code to the current mode."""
     mode = self.vacuum_state['mode']
-    is_mop = self.vacuum_state['is_mop']
-    actionMode = 0
-
     if mode == 4 and self._last_clean_point is not None:
-      method = 'set_pointclean'
-      param = [1, self._last_clean_point[0], self._last_clean_point[1]]
+      return 'set_pointclean', [op_code, self._last_clean_point[0], self._last_clean_point[1]]
+    if mode == 3:
+      return 'set_mode', [3, op_code]
+    if mode == 2:
+      action_mode = 2
     else:
-      if mode == 2:
-        actionMode = 2
-      else:
-        if is_mop == 2:
-          actionMode = 3
-        else:
-          actionMode = is_mop
-      if mode == 3:
-        method = 'set_mode'
-        param = [3, 1]
-      else:
-        method = 'set_mode_withroom'
-        param = [actionMode, 1, 0]
-    await self._try_command("Unable to start the vacuum: %s", self._vacuum.raw_command, method, param)
+      is_mop = self.vacuum_state['is_mop']
+      action_mode = MOP_TO_ACTION_MODE.get(is_mop, is_mop)
+    return 'set_mode_withroom', [action_mode, op_code, 0]
+
+  async def _try_command_chain(self, mask_error, specs):
+    """Send a sequence of raw commands in one executor job, stopping on the first error."""
+    def run():
+      for method, params in specs:
+        self._raw(method, params)
+
+    return await self._try_command(mask_error, run)
+
+  async def async_start(self):
+    """Start or resume the cleaning task."""
+    method, param = self._mode_command(OP_START)
+    await self._try_command("Unable to start the vacuum: %s", self._raw, method, param)
 
   async def async_pause(self):
     """Pause the cleaning task."""
-    mode = self.vacuum_state['mode']
-    is_mop = self.vacuum_state['is_mop']
-    actionMode = 0
-
-    if mode == 4 and self._last_clean_point is not None:
-      method = 'set_pointclean'
-      param = [3, self._last_clean_point[0], self._last_clean_point[1]]
-    else:
-      if mode == 2:
-        actionMode = 2
-      else:
-        if is_mop == 2:
-          actionMode = 3
-        else:
-          actionMode = is_mop
-      if mode == 3:
-        method = 'set_mode'
-        param = [3, 3]
-      else:
-        method = 'set_mode_withroom'
-        param = [actionMode, 3, 0]
-    await self._try_command("Unable to set pause: %s", self._vacuum.raw_command, method, param)
+    method, param = self._mode_command(OP_PAUSE)
+    await self._try_command("Unable to set pause: %s", self._raw, method, param)
 
   async def async_stop(self, **kwargs):
     """Stop the vacuum cleaner."""
@@ -324,15 +308,15 @@ class MiroboVacuum2(StateVacuumEntity):
     else:
       method = 'set_mode'
       param = [0]
-    await self._try_command("Unable to stop: %s", self._vacuum.raw_command, method, param)
+    await self._try_command("Unable to stop: %s", self._raw, method, param)
 
   async def async_set_fan_speed(self, fan_speed, **kwargs):
     """Set fan speed."""
-    if fan_speed.capitalize() in FAN_SPEEDS:
-      fan_speed = FAN_SPEEDS[fan_speed.capitalize()]
-    else:
+    key = fan_speed.capitalize() if isinstance(fan_speed, str) else None
+    speed = FAN_SPEEDS.get(key)
+    if speed is None:
       try:
-        fan_speed = int(fan_speed)
+        speed = int(fan_speed)
       except ValueError as exc:
         _LOGGER.error(
             "Fan speed step not recognized (%s). " "Valid speeds are: %s",
@@ -341,34 +325,54 @@ class MiroboVacuum2(StateVacuumEntity):
         )
         return
     await self._try_command(
-        "Unable to set fan speed: %s", self._vacuum.raw_command, 'set_suction', [
-            fan_speed]
+        "Unable to set fan speed: %s", self._raw, 'set_suction', [speed]
     )
 
   async def async_return_to_base(self, **kwargs):
     """Set the vacuum cleaner to return to the dock."""
-    await self._try_command("Unable to return home: %s", self._vacuum.raw_command, 'set_charge', [1])
+    await self._try_command("Unable to return home: %s", self._raw, 'set_charge', [1])
 
   async def async_locate(self, **kwargs):
     """Locate the vacuum cleaner."""
-    await self._try_command("Unable to locate the botvac: %s", self._vacuum.raw_command, 'set_resetpos', [1])
+    await self._try_command("Unable to locate the botvac: %s", self._raw, 'set_resetpos', [1])
 
   async def async_send_command(self, command, params=None, **kwargs):
     """Send raw command."""
     await self._try_command(
         "Unable to send command to the vacuum: %s",
-        self._vacuum.raw_command,
+        self._raw,
         command,
         params,
     )
 
-  def update(self):
+  async def async_update(self):
     """Fetch state from the device."""
     try:
-      state = self._vacuum.raw_command('get_prop', ALL_PROPS)
+      state = await self.hass.async_add_executor_job(
+          self._raw, 'get_prop', ALL_PROPS
+      )
+      if len(state) != len(ALL_PROPS):
+        _LOGGER.warning(
+            "Got %d of %d properties while fetching the state", len(state), len(ALL_PROPS)
+        )
+        return
 
       self.vacuum_state = dict(zip(ALL_PROPS, state))
 
+      # Resolve the state once per update, properties only read it back.
+      try:
+        code = int(self.vacuum_state['run_state'])
+      except (TypeError, ValueError):
+        code = -1
+      if 0 <= code < len(STATE_CODE_TO_STATE):
+        self._state = STATE_CODE_TO_STATE[code]
+      else:
+        _LOGGER.error(
+            "STATE not supported, state_code: %s",
+            self.vacuum_state['run_state'],
+        )
+        self._state = None
+
       self._available = True
       
       # Automatically set mop based on mop_type
@@ -382,8 +386,10 @@ class MiroboVacuum2(StateVacuumEntity):
         update_mop = 1
 
       if update_mop is not None:
-        self._vacuum.raw_command('set_mop', [update_mop])
-        self.update()
+        await self.hass.async_add_executor_job(
+            self._raw, 'set_mop', [update_mop]
+        )
+        await self.async_update()
     except OSError as exc:
       _LOGGER.error("Got OSError while fetching the state: %s", exc)
     except DeviceException as exc:
@@ -391,23 +397,24 @@ class MiroboVacuum2(StateVacuumEntity):
 
   async def async_clean_zone(self, zone, repeats=1):
     """Clean selected area for the number of repeats indicated."""
-    result = []
-    i = 0
-    for z in zone:
-      x1, y2, x2, y1 = z
-      res = '_'.join(str(x) for x in [i, 0, x1, y1, x1, y2, x2, y2, x2, y1])
-      for _ in range(repeats):
-        result.append(res)
-        i += 1
-    result = [i] + result
-
-    await self._try_command("Unable to clean zone: %s", self._vacuum.raw_command, 'set_uploadmap', [1]) \
-        and await self._try_command("Unable to clean zone: %s", self._vacuum.raw_command, 'set_zone', result) \
-        and await self._try_command("Unable to clean zone: %s", self._vacuum.raw_command, 'set_mode', [3, 1])
+    zones = (
+        ZONE_FORMAT % (idx * repeats, x1, y1, x1, y2, x2, y2, x2, y1)
+        for idx, (x1, y2, x2, y1) in enumerate(zone)
+    )
+    result = [res for res in zones for _ in range(repeats)]
+    result.insert(0, len(result))
+
+    await self._try_command_chain("Unable to clean zone: %s", [
+        ('set_uploadmap', [1]),
+        ('set_zone', result),
+        ('set_mode', [3, 1]),
+    ])
 
   async def async_clean_point(self, point):
     """Clean selected area"""
     x, y = point
     self._last_clean_point = point
-    await self._try_command("Unable to clean point: %s", self._vacuum.raw_command, 'set_uploadmap', [0]) \
-        and await self._try_command("Unable to clean point: %s", self._vacuum.raw_command, 'set_pointclean', [1, x, y])
+    await self._try_command_chain("Unable to clean point: %s", [
+        ('set_uploadmap', [0]),
+        ('set_pointclean', [1, x, y]),
+    ])